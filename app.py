@@ -1,22 +1,34 @@
 from threading import Thread
 from flask import Flask
+from waitress import serve
 from base64 import urlsafe_b64decode as d64
 
 app = Flask("app")
 # Flask App Rick
-assembled_page = d64(b"".join( [
-  b"PGh0bWw-CiAgPGhlYWQ-CiAgICA8L2hlYWQ-CiAgICA8Ym9keT4KICAgICAgCiAgICAgIDxzcGFuIHN0eWxlID0icG9zaXRpb246YWJzb2x1dGU7bWluLXdpZHRoOjEwMHZ3O21heC1oZWlnaHQ6",
-  b"NzV2aDthbGlnbi1pdGVtczpjZW50ZXI7Ij4KICAgICAgPGRpdiBzdHlsZT0icG9zaXRpb246cmVsYXRpdmU7dmVydGljYWwtYWxpZ246Y2VudGVyO21pbi13aWR0aDo1MHZoO21pbi1oZWlnaHQ6",
-  b"MTBlbTt0ZXh0LWFsaWduOmNlbnRlcjsiPgogICAgICA8cD5JJ20gYSB3ZWJwYWdlLCBNb3J0eSE8YnI-CiAgICAgICAgSSB0dXJuZWQgbXlzZWxmIGludG8gYSB3ZWJwYWdlITxicj4KCiAgICAg",
-  b"IDxpbWcgc3R5bGU9InBvc2l0aW9uOnJlbGF0aXZlO21hcmdpbjoydmg7bWluLWhlaWdodDo1dmg7bWF4LWhlaWdodDo1MHZoO3dpZHRoOmF1dG8iIHNyYz0naHR0cHM6Ly9pLmltZ3VyLmNvbS9H",
-  b"U29yVmN3LnBuZyc-PC9pbWc-CiAgICAgIDxicj5JJ20gRmxhc2sgQXBwIFJpY2shITwvcD4KICAgIDwvZGl2PgogICAgPC9zcGFuPgogICAgPC9kaXY-CiAgICA8L2JvZHk-CiAgICA8L2h0bWw-"]))
+# the page never changes, so decode it and work out its headers once at import
+# rather than having flask re-encode a str on every keep-alive ping
+_PAGE_BYTES = d64(
+  b"PGh0bWw-CiAgPGhlYWQ-CiAgICA8L2hlYWQ-CiAgICA8Ym9keT4KICAgICAgCiAgICAgIDxzcGFuIHN0eWxlID0icG9zaXRpb246YWJzb2x1dGU7bWluLXdpZHRoOjEwMHZ3O21heC1oZWlnaHQ6"
+  b"NzV2aDthbGlnbi1pdGVtczpjZW50ZXI7Ij4KICAgICAgPGRpdiBzdHlsZT0icG9zaXRpb246cmVsYXRpdmU7dmVydGljYWwtYWxpZ246Y2VudGVyO21pbi13aWR0aDo1MHZoO21pbi1oZWlnaHQ6"
+  b"MTBlbTt0ZXh0LWFsaWduOmNlbnRlcjsiPgogICAgICA8cD5JJ20gYSB3ZWJwYWdlLCBNb3J0eSE8YnI-CiAgICAgICAgSSB0dXJuZWQgbXlzZWxmIGludG8gYSB3ZWJwYWdlITxicj4KCiAgICAg"
+  b"IDxpbWcgc3R5bGU9InBvc2l0aW9uOnJlbGF0aXZlO21hcmdpbjoydmg7bWluLWhlaWdodDo1dmg7bWF4LWhlaWdodDo1MHZoO3dpZHRoOmF1dG8iIHNyYz0naHR0cHM6Ly9pLmltZ3VyLmNvbS9H"
+  b"U29yVmN3LnBuZyc-PC9pbWc-CiAgICAgIDxicj5JJ20gRmxhc2sgQXBwIFJpY2shITwvcD4KICAgIDwvZGl2PgogICAgPC9zcGFuPgogICAgPC9kaXY-CiAgICA8L2JvZHk-CiAgICA8L2h0bWw-"
+)
+
+_PAGE_HEADERS = (
+    ("Content-Type", "text/html; charset=utf-8"),
+    ("Content-Length", str(len(_PAGE_BYTES))),
+)
 
 @app.route('/')
 def home():
-  return assembled_page
+  # a fresh response object per request, as flask may mutate it after returning
+  return app.response_class(_PAGE_BYTES, headers=_PAGE_HEADERS)
 
 def run():
-    app.run(host="0.0.0.0", port=8080)
+    # flask's dev server handles requests one at a time, which isn't great
+    # when uptime monitors are constantly pinging - waitress uses a thread pool
+    serve(app, host="0.0.0.0", port=8080, threads=4)
 
 
 def keep_alive():
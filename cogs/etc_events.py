@@ -1,7 +1,9 @@
 #!/usr/bin/env python3.8
+import contextlib
 import datetime
 import importlib
 
+import aioredis
 import humanize
 import nextcord
 from nextcord.ext import commands
@@ -22,12 +24,14 @@ class OnCMDError(commands.Cog):
                 guild_id=guild.id,
                 prefixes={"!?"},
             )
-            self.bot.cached_prefixes[guild.id] = {"!?"}
+            self.bot.cached_prefixes[guild.id] = frozenset({"!?"})
 
     @commands.Cog.listener()
     async def on_guild_remove(self, guild: nextcord.Guild):
         await GuildConfig.filter(guild_id=guild.id).delete()
         self.bot.cached_prefixes.pop(guild.id, None)
+        with contextlib.suppress(aioredis.RedisError):
+            await self.bot.redis.delete(utils.prefixes_redis_key(guild.id))
 
     def error_embed_generate(self, error_msg):
         return nextcord.Embed(colour=nextcord.Colour.red(), description=error_msg)
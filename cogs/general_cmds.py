@@ -7,6 +7,7 @@ import time
 import typing
 
 import aiohttp
+import aioredis
 import pydantic
 from nextcord.ext import commands
 from xbox.webapi.api.provider.profile.models import ProfileResponse
@@ -84,7 +85,10 @@ class GeneralCMDS(commands.Cog):
 
             guild_config.prefixes.add(prefix)
             await guild_config.save()
-            ctx.bot.cached_prefixes[ctx.guild.id].add(prefix)
+            ctx.bot.cached_prefixes[ctx.guild.id] = frozenset(guild_config.prefixes)
+            # the prefix is already saved, so don't fail the command over the cache
+            with contextlib.suppress(aioredis.RedisError):
+                await ctx.bot.redis.delete(utils.prefixes_redis_key(ctx.guild.id))
 
         await ctx.reply(f"Added `{prefix}`!")
 
@@ -100,7 +104,9 @@ class GeneralCMDS(commands.Cog):
                 guild_config = await ctx.fetch_config()
                 guild_config.prefixes.remove(prefix)
                 await guild_config.save()
-                ctx.bot.cached_prefixes[ctx.guild.id].remove(prefix)
+                ctx.bot.cached_prefixes[ctx.guild.id] = frozenset(guild_config.prefixes)
+                with contextlib.suppress(aioredis.RedisError):
+                    await ctx.bot.redis.delete(utils.prefixes_redis_key(ctx.guild.id))
 
             except KeyError:
                 raise commands.BadArgument(
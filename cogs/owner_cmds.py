@@ -1,17 +1,17 @@
 import asyncio
+import contextlib
 import importlib
-import os
 
+import aioredis
 import nextcord
 from nextcord.ext import application_checks
 from nextcord.ext import commands
 from nextcord.types.interactions import PartialGuildApplicationCommandPermissions
 
 import common.utils as utils
+from common.config import DEV_GUILD_ID
 from common.models import GuildConfig
 
-DEV_GUILD_ID = int(os.environ["DEV_GUILD_ID"])
-
 
 class OwnerCMDs(commands.Cog, name="Owner", command_attrs=dict(hidden=True)):
     def __init__(self, bot):
@@ -258,6 +258,9 @@ class OwnerCMDs(commands.Cog, name="Owner", command_attrs=dict(hidden=True)):
     ):
         await inter.response.defer()
         await GuildConfig.filter(guild_id=int(guild_id)).delete()
+        self.bot.cached_prefixes.pop(int(guild_id), None)
+        with contextlib.suppress(aioredis.RedisError):
+            await self.bot.redis.delete(utils.prefixes_redis_key(int(guild_id)))
         await inter.send("Deleted!")
 
     @edit_guild.on_autocomplete("guild_id")
@@ -0,0 +1,22 @@
+import os
+
+import tomli
+
+# load the config file, keeping the values as their toml types
+# we allow the user to set a configuration location via an already-set
+# env var if they wish, but it'll default to config.toml in the running
+# directory
+CONFIG_LOCATION = os.environ.get("CONFIG_LOCATION", "config.toml")
+with open(CONFIG_LOCATION, "rb") as f:
+    _toml_config: dict = tomli.load(f)
+
+# the environment is used as a base so settings only set there (like replit
+# secrets) still work, but the config file wins if both have a value
+# note that this means values only in the environment will be strings
+CONFIG: dict = {**os.environ, **_toml_config}
+
+# also load the config file into environment variables
+# some libraries and older bits of code still read from there
+os.environ.update({key: str(value) for key, value in _toml_config.items()})
+
+DEV_GUILD_ID = int(CONFIG["DEV_GUILD_ID"])
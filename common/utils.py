@@ -1,9 +1,10 @@
 #!/usr/bin/env python3.8
-import collections
+import functools
+import itertools
 import logging
+import os
 import traceback
 import typing
-from pathlib import Path
 
 import aiohttp
 import aioredis
@@ -42,12 +43,9 @@ async def error_handle(bot, error, ctx=None):
         error_str = error_format(error)
         logging.getLogger("discord").error(error_str)
 
-        chunks = line_split(error_str)
-        for i in range(len(chunks)):
-            chunks[i][0] = f"```py\n{chunks[i][0]}"
-            chunks[i][len(chunks[i]) - 1] += "\n```"
-
-        final_chunks = ["\n".join(chunk) for chunk in chunks]
+        final_chunks = [
+            "```py\n" + "\n".join(chunk) + "\n```" for chunk in line_split(error_str)
+        ]
         if ctx and hasattr(ctx, "message") and hasattr(ctx.message, "jump_url"):
             final_chunks.insert(0, f"Error on: {ctx.message.jump_url}")
 
@@ -73,18 +71,15 @@ async def error_handle(bot, error, ctx=None):
 async def msg_to_owner(bot, content, split=True):
     # sends a message to the owner
     owner = bot.owner
-    string = str(content)
-
-    str_chunks = string_split(string) if split else content
+    str_chunks = string_split(str(content)) if split else content
     for chunk in str_chunks:
         await owner.send(f"{chunk}")
 
 
 def line_split(content: str, split_by=20):
-    content_split = content.splitlines()
-    return [
-        content_split[x : x + split_by] for x in range(0, len(content_split), split_by)
-    ]
+    # splits a string into lists of at most split_by lines
+    lines = iter(content.splitlines())
+    return list(iter(lambda: list(itertools.islice(lines, split_by)), []))
 
 
 def embed_check(embed: nextcord.Embed) -> bool:
@@ -104,44 +99,76 @@ def embed_check(embed: nextcord.Embed) -> bool:
     if embed.fields:
         if len(embed.fields) > 25:
             return False
-        for field in embed.fields:
-            if field.name and len(field.name) > 1024:
-                return False
-            if field.value and len(field.value) > 2048:
-                return False
+        if any(
+            len(field.name or "") > 256 or len(field.value or "") > 1024
+            for field in embed.fields
+        ):
+            return False
 
     return True
 
 
+@functools.lru_cache(maxsize=256)
+def _deny_mentions_for(user_id: int):
+    return nextcord.AllowedMentions(
+        everyone=False, users=[nextcord.Object(user_id)], roles=False
+    )
+
+
 def deny_mentions(user):
     # generates an AllowedMentions object that only pings the user specified
-    return nextcord.AllowedMentions(everyone=False, users=[user], roles=False)
+    # these are never mutated, so the same object can be reused per user
+    return _deny_mentions_for(user.id)
 
 
 def error_format(error):
     # simple function that formats an exception
-    return "".join(
-        traceback.format_exception(
-            etype=type(error), value=error, tb=error.__traceback__
-        )
-    )
+    return "".join(traceback.TracebackException.from_exception(error).format())
 
 
 def string_split(string):
-    # simple function that splits a string into 1950-character parts
-    return [string[i : i + 1950] for i in range(0, len(string), 1950)]
+    # simple function that splits a string into parts of at most 1950 utf-8 bytes
+    encoded = string.encode("utf-8", "backslashreplace")
+    length = len(encoded)
+    chunks = []
+
+    start = 0
+    while start < length:
+        end = min(start + 1950, length)
+        while end < length and (encoded[end] & 0xC0) == 0x80:
+            end -= 1
+        chunks.append(encoded[start:end].decode("utf-8"))
+        start = end
+
+    return chunks
+
+
+_PATH_TO_EXT = str.maketrans({"/": ".", "\\": "."})
 
 
 def file_to_ext(str_path, base_path):
     # changes a file to an import-like string
-    str_path = str_path.replace(base_path, "")
-    str_path = str_path.replace("/", ".")
-    return str_path.replace(".py", "")
+    if str_path.startswith(base_path):
+        str_path = str_path[len(base_path) :]
+    if str_path.endswith(".py"):
+        str_path = str_path[:-3]
+    return str_path.translate(_PATH_TO_EXT)
+
+
+def _walk_py_files(dir_path):
+    # recursively yields the paths of all python files in a directory
+    # scandir gives us the file type for free, unlike pathlib's glob
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_py_files(entry.path)
+            elif entry.name.endswith(".py"):
+                yield entry.path
 
 
 def get_all_extensions(str_path, folder="cogs"):
     # gets all extensions in a folder
-    ext_files = collections.deque()
+    ext_files = []
     loc_split = str_path.split("cogs")
     base_path = loc_split[0]
 
@@ -152,17 +179,28 @@ def get_all_extensions(str_path, folder="cogs"):
     if base_path[-1] != "/":
         base_path += "/"
 
-    pathlist = Path(f"{base_path}/{folder}").glob("**/*.py")
-    for path in pathlist:
-        str_path = str(path.as_posix())
-        str_path = file_to_ext(str_path, base_path)
+    for path in _walk_py_files(f"{base_path}{folder}"):
+        ext = file_to_ext(path, base_path)
 
-        if str_path != "cogs.db_handler":
-            ext_files.append(str_path)
+        if ext != "cogs.db_handler":
+            ext_files.append(ext)
 
     return ext_files
 
 
+def pooled_db_url(db_url, minsize=5, maxsize=20):
+    # sets the size of tortoise's connection pool via the db url
+    # tortoise defaults to 1-5 connections, which is a bit low when prefix
+    # lookups can happen for every message the bot sees
+    separator = "&" if "?" in db_url else "?"
+    return f"{db_url}{separator}minsize={minsize}&maxsize={maxsize}"
+
+
+def prefixes_redis_key(guild_id):
+    # the key a guild's prefixes are cached under in redis
+    return f"pfx:{guild_id}"
+
+
 def toggle_friendly_str(bool_to_convert):
     return "on" if bool_to_convert == True else "off"
 
@@ -219,7 +257,8 @@ if typing.TYPE_CHECKING:
         club: ClubProvider
         owner: nextcord.User
         redis: aioredis.Redis
-        cached_prefixes: typing.DefaultDict[int, typing.Set[str]]
+        cached_prefixes: typing.Dict[int, typing.FrozenSet[str]]
+        mention_prefixes: typing.FrozenSet[str]
 
         async def get_context(self, message, *, cls=RealmContext) -> RealmContext:
             ...
@@ -32,16 +32,20 @@ async def port_from_file():  # optional to use if you have a config file from wa
         async with session.get(document_url, headers=headers) as resp:
             old_config: dict = await resp.json(content_type="text/plain")
 
-    for guild_id, config_json in old_config.items():
-        await GuildConfig.create(
-            guild_id=int(guild_id),
-            playerlist_chan=config_json["playerlist_chan"],
-            club_id=config_json["club_id"]
-            if config_json["club_id"] != "None"
-            else None,
-            online_cmd=config_json["online_cmd"],
-            prefixes={"!?"},
-        )
+    await GuildConfig.bulk_create(
+        [
+            GuildConfig(
+                guild_id=int(guild_id),
+                playerlist_chan=config_json["playerlist_chan"],
+                club_id=config_json["club_id"]
+                if config_json["club_id"] != "None"
+                else None,
+                online_cmd=config_json["online_cmd"],
+                prefixes={"!?"},
+            )
+            for guild_id, config_json in old_config.items()
+        ]
+    )
 
 
 async def migrate():
@@ -56,14 +60,17 @@ async def migrate():
             "ALTER TABLE realmguildconfig ADD prefixes VARCHAR(40)[] DEFAULT '{}'"
         )
 
-        config_data = await conn.fetch("SELECT * from realmguildconfig")
+        config_data = await conn.fetch(
+            "SELECT guild_id, old_prefixes from realmguildconfig"
+        )
 
-        for config in config_data:
-            new_prefixes = orjson.loads(config["old_prefixes"])
-            await conn.execute(
-                "UPDATE realmguildconfig SET prefixes = $1",
-                new_prefixes,
-            )
+        await conn.executemany(
+            "UPDATE realmguildconfig SET prefixes = $1 WHERE guild_id = $2",
+            [
+                (orjson.loads(config["old_prefixes"]), config["guild_id"])
+                for config in config_data
+            ],
+        )
 
         await conn.execute("ALTER TABLE realmguildconfig DROP COLUMN old_prefixes")
 
@@ -1,6 +1,7 @@
 from threading import Thread
 
 from flask import Flask
+from waitress import serve
 
 app = Flask("")
 
@@ -11,7 +12,9 @@ def main():
 
 
 def run():
-    app.run(host="0.0.0.0", port=8080)
+    # flask's dev server handles requests one at a time, which isn't great
+    # when uptime monitors are constantly pinging - waitress uses a thread pool
+    serve(app, host="0.0.0.0", port=8080, threads=4)
 
 
 def keep_alive():
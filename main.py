@@ -1,13 +1,12 @@
 import asyncio
 import contextlib
+import datetime
 import logging
-import os
-from collections import defaultdict
+import typing
 
 import aiohttp
 import aioredis
 import nextcord
-import tomli
 from nextcord.ext import commands
 from tortoise import Tortoise
 from tortoise.exceptions import ConfigurationError
@@ -19,68 +18,82 @@ from xbox.webapi.authentication.models import OAuth2TokenResponse
 
 import common.utils as utils
 import keep_alive
+from common.config import CONFIG
+from common.config import DEV_GUILD_ID
 from common.custom_providers import ClubProvider
 from common.custom_providers import ProfileProvider
 from common.help_cmd import PaginatedHelpCommand
 from common.models import GuildConfig
 
 
-# load the config file into environment variables
-# this allows an easy way to access these variables from any file
-# we allow the user to set a configuration location via an already-set
-# env var if they wish, but it'll default to config.toml in the running
-# directory
-CONFIG_LOCATION = os.environ.get("CONFIG_LOCATION", "config.toml")
-with open(CONFIG_LOCATION, "rb") as f:
-    toml_dict = tomli.load(f)
-    for key, value in toml_dict.items():
-        os.environ[key] = str(value)
-
-
 logger = logging.getLogger("nextcord")
 logger.setLevel(logging.INFO)
 handler = logging.FileHandler(
-    filename=os.environ["LOG_FILE_PATH"], encoding="utf-8", mode="a"
+    filename=CONFIG["LOG_FILE_PATH"], encoding="utf-8", mode="a"
 )
 handler.setFormatter(
     logging.Formatter("%(asctime)s:%(levelname)s:%(name)s: %(message)s")
 )
 logger.addHandler(handler)
 
-DEV_GUILD_ID = int(os.environ["DEV_GUILD_ID"])
+
+_NO_PREFIXES = frozenset()
+_DEFAULT_PREFIXES = frozenset({"!?"})
 
 
 async def _get_prefixes(bot: utils.RealmBotBase, msg: nextcord.Message):
     if not msg.guild:
-        return set()
-
-    if prefixes := bot.cached_prefixes[msg.guild.id]:
+        return _NO_PREFIXES
+
+    # an empty set is still a cached value, so check against None instead
+    cached = bot.cached_prefixes.get(msg.guild.id)
+    if cached is not None:
+        return cached
+
+    # redis is a lot quicker to ask than postgres, so try that first
+    # note that an empty set can't be stored in redis, so guilds with no
+    # prefixes always fall through - they're cached above afterwards anyways
+    # redis is only a cache here, so if it's having issues, just use postgres
+    # it also isn't set up until on_init_load runs, so check for that too
+    redis = getattr(bot, "redis", None)
+    redis_key = utils.prefixes_redis_key(msg.guild.id)
+    prefixes = None
+    if redis:
+        with contextlib.suppress(aioredis.RedisError):
+            prefixes = await redis.smembers(redis_key)
+
+    if prefixes:
+        prefixes = bot.cached_prefixes[msg.guild.id] = frozenset(prefixes)
         return prefixes
 
     guild_config = await GuildConfig.get(guild_id=msg.guild.id)
-    prefixes = bot.cached_prefixes[msg.guild.id] = guild_config.prefixes
+    prefixes = bot.cached_prefixes[msg.guild.id] = frozenset(guild_config.prefixes)
+
+    if prefixes and redis:
+        with contextlib.suppress(aioredis.RedisError):
+            async with redis.pipeline() as pipe:
+                pipe.sadd(redis_key, *prefixes)
+                pipe.expire(redis_key, datetime.timedelta(hours=1))
+                await pipe.execute()
+
     return prefixes
 
 
 async def realms_playerlist_prefixes(bot: utils.RealmBotBase, msg: nextcord.Message):
-    mention_prefixes = {f"{bot.user.mention} ", f"<@!{bot.user.id}> "}
-
     try:
         custom_prefixes = await _get_prefixes(bot, msg)
-    except DoesNotExist:
-        # guild hasnt been added yet
-        custom_prefixes = set()
     except AttributeError:
         # prefix handling runs before command checks, so there's a chance there's no guild
-        custom_prefixes = {"!?"}
-    except ConfigurationError:  # prefix handling also runs before on_ready sometimes
-        custom_prefixes = set()
-    except KeyError:  # rare possibility, but you know
-        custom_prefixes = set()
-    except asyncio.TimeoutError:  # happens right before reconnects
-        custom_prefixes = set()
+        custom_prefixes = _DEFAULT_PREFIXES
+    except (
+        DoesNotExist,  # guild hasnt been added yet
+        ConfigurationError,  # prefix handling also runs before on_ready sometimes
+        KeyError,  # rare possibility, but you know
+        asyncio.TimeoutError,  # happens right before reconnects
+    ):
+        custom_prefixes = _NO_PREFIXES
 
-    return mention_prefixes.union(custom_prefixes)
+    return bot.mention_prefixes | custom_prefixes
 
 
 def global_checks(ctx: commands.Context[utils.RealmBotBase]):
@@ -104,17 +117,18 @@ def global_checks(ctx: commands.Context[utils.RealmBotBase]):
 
 async def on_init_load():
     await Tortoise.init(
-        db_url=os.environ.get("DB_URL"), modules={"models": ["common.models"]}
+        db_url=utils.pooled_db_url(CONFIG["DB_URL"]),
+        modules={"models": ["common.models"]},
     )
-    bot.redis = aioredis.from_url(os.environ.get("REDIS_URL"), decode_responses=True)
+    bot.redis = aioredis.from_url(CONFIG.get("REDIS_URL"), decode_responses=True)
 
     await bot.wait_until_ready()
 
     bot.session = aiohttp.ClientSession()
     auth_mgr = AuthenticationManager(
-        bot.session, os.environ["XBOX_CLIENT_ID"], os.environ["XBOX_CLIENT_SECRET"], ""
+        bot.session, CONFIG["XBOX_CLIENT_ID"], CONFIG["XBOX_CLIENT_SECRET"], ""
     )
-    auth_mgr.oauth = OAuth2TokenResponse.parse_file(os.environ["XAPI_TOKENS_LOCATION"])
+    auth_mgr.oauth = OAuth2TokenResponse.parse_file(CONFIG["XAPI_TOKENS_LOCATION"])
     await auth_mgr.refresh_tokens()
     xbl_client = XboxLiveClient(auth_mgr)
     bot.profile = ProfileProvider(xbl_client)
@@ -122,13 +136,14 @@ async def on_init_load():
 
     bot.load_extension("onami")
 
-    cogs_list = utils.get_all_extensions(os.environ["DIRECTORY_OF_BOT"])
+    cogs_list = utils.get_all_extensions(CONFIG["DIRECTORY_OF_BOT"])
     for cog in cogs_list:
         if cog != "cogs.owner_cmds":
             with contextlib.suppress(commands.NoEntryPointError):
                 bot.load_extension(cog)
     application = await bot.application_info()
     bot.owner = application.owner
+    bot._owner_ready.set()
 
 
 class RealmsPlayerlistBot(utils.RealmBotBase):
@@ -146,10 +161,17 @@ class RealmsPlayerlistBot(utils.RealmBotBase):
             **options,
         )
         self._checks.append(global_checks)
+        self.mention_prefixes = frozenset()
+        self._owner_ready = asyncio.Event()
 
     async def on_ready(self):
-        while not hasattr(self, "owner"):
-            await asyncio.sleep(0.1)
+        # the mention prefixes only change if the user does, so build them
+        # here rather than on every single message
+        self.mention_prefixes = frozenset(
+            (f"<@{self.user.id}> ", f"<@!{self.user.id}> ")
+        )
+
+        await self._owner_ready.wait()
 
         utcnow = nextcord.utils.utcnow()
         time_format = nextcord.utils.format_dt(utcnow)
@@ -222,12 +244,12 @@ bot = RealmsPlayerlistBot(
     intents=intents,
 )
 
-bot.cached_prefixes = defaultdict(set)
+bot.cached_prefixes: typing.Dict[int, typing.FrozenSet[str]] = {}
 bot.init_load = True
-bot.color = nextcord.Color(int(os.environ["BOT_COLOR"]))  # 8ac249, aka 9093705
+bot.color = nextcord.Color(int(CONFIG["BOT_COLOR"]))  # 8ac249, aka 9093705
 
 
 bot.load_extension("cogs.owner_cmds")
 bot.loop.create_task(on_init_load())
 # keep_alive.keep_alive()
-bot.run(os.environ["MAIN_TOKEN"])
+bot.run(CONFIG["MAIN_TOKEN"])